@@ -58,6 +58,8 @@ class PodcastConfig:
         long_context_llm_provider (str): Provider to use for long context operations
         tts_provider (str): Text-to-speech service provider
         tts_settings (Dict): Configuration settings for TTS
+        tts_concurrency (int): Maximum number of TTS requests to run in parallel
+        tts_cache_size_mb (int): Size cap for the synthesized audio cache, 0 disables it
         output_format (str): Format for output audio files
         temp_audio_dir (str): Directory for temporary audio files
         output_dir (str): Directory for final output files
@@ -84,6 +86,8 @@ class PodcastConfig:
     # TTS Config 
     tts_provider: str
     tts_settings: Dict
+    tts_concurrency: int
+    tts_cache_size_mb: int
     
     # Output Config
     output_format: str
@@ -166,8 +170,16 @@ class PodcastConfig:
                     },
                     'language_code': 'en-US',
                     'effects_profile_id': 'small-bluetooth-speaker-class-device'
+                },
+                'multi': {
+                    'provider_mapping': {
+                        'Interviewer': 'google',
+                        'Interviewee': 'elevenlabs'
+                    }
                 }
             },
+            'tts_concurrency': 4,
+            'tts_cache_size_mb': 100,
             'output_format': 'mp3',
             'temp_audio_dir': './.temp_audio',
             'output_dir': './output',
@@ -7,8 +7,8 @@ multiple TTS providers (Google Cloud TTS and ElevenLabs). It includes functional
 - Rate limiting API requests to stay within provider quotas
 - Exponential backoff retry logic for API resilience 
 - Processing individual conversation lines with appropriate voices
+- Caching synthesized lines on disk so repeated text is not re-synthesized
 - Merging multiple audio segments into a complete podcast
-- Managing temporary audio file storage and cleanup
 
 The module supports different voices for interviewer/interviewee to create natural
 conversational flow and allows configuration of voice settings and audio effects
@@ -26,9 +26,14 @@ Typical usage:
 """
 
 
+import hashlib
 import logging
 import os
-from io import BytesIO
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import wraps
 from pathlib import Path
 from typing import List
 
@@ -39,6 +44,7 @@ from pydub import AudioSegment
 
 from podcast_llm.config import PodcastConfig
 from podcast_llm.utils.rate_limits import (
+    RateLimiter,
     rate_limit_per_minute,
     retry_with_exponential_backoff
 )
@@ -46,6 +52,231 @@ from podcast_llm.utils.rate_limits import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds allowed for the connection warm-up request before it is abandoned
+_WARM_UP_TIMEOUT = 5
+
+# Buffer size for files written from streamed provider responses
+_STREAM_WRITE_BUFFER_SIZE = 1 << 16
+
+# Characters stripped from script text before synthesis, removed in a single pass
+_TTS_CLEAN_TABLE = str.maketrans('', '', '*_—')
+_LINE_SEPARATOR = '\x00'
+
+# Providers that synthesize audio themselves, and so can be assigned to speakers by 'multi'
+_SYNTHESIS_PROVIDERS = ('google', 'elevenlabs', 'google_multispeaker')
+
+# Formats whose encoded streams can be joined by the concat demuxer without re-encoding
+_STREAM_COPY_FORMATS = {'mp3', 'ogg'}
+
+# Encoders used when a merge has to re-encode; Ogg output carries Opus speech
+_EXPORT_CODECS = {'ogg': 'libopus'}
+
+# PCM layout used when audio has to be decoded and re-encoded during a merge
+_MERGE_FRAME_RATE = 24000
+_MERGE_CHANNELS = 1
+_MERGE_SAMPLE_WIDTH = 2
+
+
+def _thread_safe_cache(func):
+    """
+    Memoize a TTS client or settings factory so each distinct set of arguments is built only once.
+
+    Cache hits are plain dictionary lookups and never take a lock. Misses take a lock
+    private to the wrapped factory and check again before building, so concurrent workers
+    missing at the same time do not each construct (and authenticate) their own client,
+    and a slow construction never blocks lookups in other caches.
+    """
+    cache = {}
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(*args):
+        try:
+            return cache[args]
+        except KeyError:
+            pass
+
+        with lock:
+            if args not in cache:
+                cache[args] = func(*args)
+            return cache[args]
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+def _as_tuple(settings: dict) -> tuple:
+    """
+    Convert a (possibly nested) settings dictionary into a hashable, order-independent tuple.
+
+    Nested dictionaries and lists, such as a list of effects profiles, are converted too.
+    """
+    return tuple(sorted((key, _hashable(value)) for key, value in settings.items()))
+
+
+def _hashable(value):
+    """
+    Convert a settings value into a hashable equivalent, recursing into dicts and lists.
+    """
+    if isinstance(value, dict):
+        return _as_tuple(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+@_thread_safe_cache
+def _google_static(api_key: str, tts_settings: tuple, audio_format: str) -> tuple:
+    """
+    Build the Google TTS client and the request parameters that stay fixed for a run.
+
+    Args:
+        api_key (str): Google API key
+        tts_settings (tuple): Google TTS settings converted with _as_tuple()
+        audio_format (str): Audio format to request ('mp3' or 'ogg' for Ogg Opus)
+
+    Returns:
+        tuple: (client, interviewer_voice, interviewee_voice, audio_config)
+    """
+    settings = dict(tts_settings)
+    voice_mapping = dict(settings['voice_mapping'])
+
+    client = texttospeech.TextToSpeechClient(client_options={'api_key': api_key})
+
+    interviewer_voice = texttospeech.VoiceSelectionParams(
+        language_code=settings['language_code'],
+        name=voice_mapping['Interviewer'],
+        ssml_gender=texttospeech.SsmlVoiceGender.FEMALE
+    )
+
+    interviewee_voice = texttospeech.VoiceSelectionParams(
+        language_code=settings['language_code'],
+        name=voice_mapping['Interviewee'],
+        ssml_gender=texttospeech.SsmlVoiceGender.MALE
+    )
+
+    # Select the type of audio file you want returned
+    audio_config = texttospeech.AudioConfig(
+        audio_encoding=(
+            texttospeech.AudioEncoding.OGG_OPUS if audio_format == 'ogg'
+            else texttospeech.AudioEncoding.MP3
+        ),
+        effects_profile_id=settings['effects_profile_id']
+    )
+
+    return client, interviewer_voice, interviewee_voice, audio_config
+
+
+@_thread_safe_cache
+def _get_google_multispeaker_client(api_key: str) -> texttospeech_v1beta1.TextToSpeechClient:
+    """
+    Get the Google multi-speaker TTS client shared across lines.
+
+    Args:
+        api_key (str): Google API key
+
+    Returns:
+        texttospeech_v1beta1.TextToSpeechClient: Client for the v1beta1 TTS API
+    """
+    return texttospeech_v1beta1.TextToSpeechClient(client_options={'api_key': api_key})
+
+
+@_thread_safe_cache
+def _get_elevenlabs_client(api_key: str) -> elevenlabs_client.ElevenLabs:
+    """
+    Get the ElevenLabs client shared across lines.
+
+    Args:
+        api_key (str): ElevenLabs API key
+
+    Returns:
+        elevenlabs_client.ElevenLabs: ElevenLabs API client
+    """
+    return elevenlabs_client.ElevenLabs(api_key=api_key)
+
+
+@_thread_safe_cache
+def _get_rate_limiter(quota: str, requests_per_minute: int) -> RateLimiter:
+    """
+    Get the limiter for a provider quota, creating it on first use.
+
+    Args:
+        quota (str): Name of the rate limit quota, e.g. 'google' or 'elevenlabs'
+        requests_per_minute (int): Requests allowed per minute under the quota
+
+    Returns:
+        RateLimiter: Limiter shared by every caller of the quota
+    """
+    return RateLimiter(requests_per_minute)
+
+
+def _rate_limiter(config: PodcastConfig, provider: str) -> RateLimiter:
+    """
+    Get the limiter shared by every worker calling a provider.
+
+    Limits come from config.rate_limits. Both Google providers draw on the same API key,
+    so they share the 'google' quota.
+
+    Args:
+        config (PodcastConfig): Configuration object containing rate limit settings
+        provider (str): TTS provider about to be called
+
+    Returns:
+        RateLimiter: Limiter for the provider's quota
+    """
+    quota = 'google' if provider == 'google_multispeaker' else provider
+    return _get_rate_limiter(quota, config.rate_limits[quota]['requests_per_minute'])
+
+
+def _line_provider(config: PodcastConfig, speaker: str) -> str:
+    """
+    Get the TTS provider that voices a speaker.
+
+    With the 'multi' provider each speaker is assigned a provider through
+    config.tts_settings['multi']['provider_mapping'], so both providers' rate limits are
+    used in parallel. Otherwise every line uses config.tts_provider.
+
+    Args:
+        config (PodcastConfig): Configuration object containing TTS settings
+        speaker (str): Speaker identifier
+
+    Returns:
+        str: TTS provider name
+    """
+    if config.tts_provider == 'multi':
+        return config.tts_settings['multi']['provider_mapping'][speaker]
+    return config.tts_provider
+
+
+def _check_provider_mapping(config: PodcastConfig, conversation: List[dict]) -> None:
+    """
+    Check that the 'multi' provider assigns a supported provider to every speaker.
+
+    Speaker labels come from the LLM and user configs may omit the 'multi' settings, so the
+    mapping is validated once up front rather than failing part-way through synthesis.
+
+    Args:
+        config (PodcastConfig): Configuration object containing TTS settings
+        conversation (List[dict]): Conversation lines, each with a 'speaker' key
+
+    Raises:
+        ValueError: If the mapping is missing, misses a speaker or names an unsupported provider
+    """
+    provider_mapping = config.tts_settings.get('multi', {}).get('provider_mapping')
+    if not provider_mapping:
+        raise ValueError("The 'multi' TTS provider requires tts_settings.multi.provider_mapping.")
+
+    for speaker in sorted({line['speaker'] for line in conversation}):
+        if speaker not in provider_mapping:
+            raise ValueError(f"The speaker '{speaker}' is missing from tts_settings.multi.provider_mapping.")
+
+    for speaker, provider in provider_mapping.items():
+        if provider not in _SYNTHESIS_PROVIDERS:
+            raise ValueError(
+                f"The provider '{provider}' mapped to speaker '{speaker}' is not supported "
+                f"(options: {', '.join(_SYNTHESIS_PROVIDERS)})."
+            )
+
 
 
 def clean_text_for_tts(lines: List) -> List:
@@ -54,7 +285,8 @@ def clean_text_for_tts(lines: List) -> List:
 
     Takes a list of dictionaries containing speaker and text information and removes
     characters that may interfere with text-to-speech synthesis, such as asterisks,
-    underscores, and em dashes.
+    underscores, and em dashes. Lines left with no speakable text are dropped so they
+    are never sent to the TTS provider.
 
     Args:
         lines (List[dict]): List of dictionaries with structure:
@@ -66,49 +298,146 @@ def clean_text_for_tts(lines: List) -> List:
     Returns:
         List[dict]: List of dictionaries with cleaned text and same structure as input
     """
-    cleaned = []
-    for l in lines:
-        cleaned.append({'speaker': l['speaker'], 'text': l['text'].replace("*", "").replace("_", "").replace("—", "")})
+    # Clean the whole script in a single translate() call by joining the lines around a
+    # separator the table never strips, then splitting them apart again.
+    script = _LINE_SEPARATOR.join(l['text'] for l in lines)
+    if script.count(_LINE_SEPARATOR) == len(lines) - 1:
+        texts = script.translate(_TTS_CLEAN_TABLE).split(_LINE_SEPARATOR)
+    else:
+        # A line contains the separator itself, so clean line by line instead
+        texts = [l['text'].translate(_TTS_CLEAN_TABLE) for l in lines]
+
+    cleaned = [{'speaker': l['speaker'], 'text': text} for l, text in zip(lines, texts) if text.strip()]
+
+    if len(cleaned) < len(lines):
+        logger.info(f"Dropped {len(lines) - len(cleaned)} empty lines from the script")
 
     return cleaned
 
 
 
-def merge_audio_files(audio_files: List, output_file: str, audio_format: str) -> None:
+def _tts_audio_format(provider: str, output_format: str) -> str:
+    """
+    Choose the audio format to request from a TTS provider.
+
+    Google providers can return Ogg Opus, which is several times smaller than MP3 for the
+    same speech quality, so it is requested whenever the podcast itself is written as Ogg
+    and the lines can be stream-copied into the output. Everything else is requested as MP3.
+
+    Args:
+        provider (str): TTS provider name
+        output_format (str): Format of the final podcast audio (e.g. 'mp3', 'ogg', 'wav')
+
+    Returns:
+        str: 'ogg' or 'mp3'
+    """
+    if output_format == 'ogg' and provider in ('google', 'google_multispeaker'):
+        return 'ogg'
+    return 'mp3'
+
+
+def _concat_audio_files(audio_files: List, output_file: str) -> None:
+    """
+    Concatenate encoded audio files with ffmpeg's concat demuxer without re-encoding.
+
+    Args:
+        audio_files (list): List of paths to audio files sharing the same codec parameters
+        output_file (str): Path where the concatenated audio file should be saved
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as concat_list:
+        for filename in audio_files:
+            escaped = os.path.abspath(filename).replace("'", "'\\''")
+            concat_list.write(f"file '{escaped}'\n")
+
+    try:
+        subprocess.run(
+            [
+                AudioSegment.converter, '-hide_banner', '-loglevel', 'error', '-y',
+                '-f', 'concat', '-safe', '0', '-i', concat_list.name,
+                '-c', 'copy', output_file
+            ],
+            check=True
+        )
+    finally:
+        os.remove(concat_list.name)
+
+
+def merge_audio_files(audio_files: List, output_file: str, audio_format: str, reencode: bool = False) -> None:
     """
     Merge multiple audio files into a single output file.
 
     Takes a list of audio files and combines them in the provided order into a single output
-    file. Handles any audio format supported by pydub.
+    file. When the inputs are already encoded in the output format, the encoded streams are
+    stitched together with ffmpeg's concat demuxer, avoiding a full decode and re-encode.
+    This requires every input to share the same stream parameters, so callers merging audio
+    from more than one TTS provider (which synthesize at different sample rates) must pass
+    reencode=True. Otherwise each file is decoded with pydub, which handles any supported audio format,
+    normalized to 24 kHz mono 16-bit PCM and streamed into a single ffmpeg encoder.
 
     Args:
         audio_files (list): List of paths to audio files to merge
         output_file (str): Path where merged audio file should be saved
         audio_format (str): Format of input/output audio files (e.g. 'mp3', 'wav')
+        reencode (bool): Decode and re-encode every file even when the formats match
 
     Returns:
         None
 
     Raises:
+        ValueError: If there are no audio files to merge
         Exception: If there are any errors during the merging process
     """
-    logger.info("Merging audio files...")
-    try:
-        combined = AudioSegment.empty()
-
-        for filename in audio_files:
-            audio = AudioSegment.from_file(filename)
+    if not audio_files:
+        raise ValueError('No audio files to merge.')
 
-            combined += audio
+    logger.info("Merging audio files...")
+    if not reencode and audio_format in _STREAM_COPY_FORMATS and all(
+            Path(filename).suffix == f'.{audio_format}' for filename in audio_files):
+        _concat_audio_files(audio_files, output_file)
+        return
+
+    # Format-specific loaders skip pydub's format detection
+    loaders = {
+        'mp3': AudioSegment.from_mp3,
+        'wav': AudioSegment.from_wav,
+        'ogg': AudioSegment.from_ogg
+    }
 
-        combined.export(output_file, format=audio_format)
-    except Exception as e:
-        raise
+    # Speech is decoded to mono 16-bit PCM at a fixed rate and piped segment by segment
+    # into a single ffmpeg encoder, so only one segment is ever held in memory.
+    command = [
+        AudioSegment.converter, '-hide_banner', '-loglevel', 'error', '-y',
+        '-f', 's16le', '-ar', str(_MERGE_FRAME_RATE), '-ac', str(_MERGE_CHANNELS), '-i', 'pipe:0'
+    ]
+    if audio_format in _EXPORT_CODECS:
+        command += ['-c:a', _EXPORT_CODECS[audio_format]]
+    command += ['-f', audio_format, output_file]
+
+    with subprocess.Popen(command, stdin=subprocess.PIPE) as encoder:
+        try:
+            for filename in audio_files:
+                loader = loaders.get(Path(filename).suffix.lstrip('.'), AudioSegment.from_file)
+                segment = loader(filename) \
+                    .set_channels(_MERGE_CHANNELS) \
+                    .set_frame_rate(_MERGE_FRAME_RATE) \
+                    .set_sample_width(_MERGE_SAMPLE_WIDTH)
+                encoder.stdin.write(segment.raw_data)
+        except Exception:
+            encoder.kill()
+            raise
+
+        encoder.stdin.close()
+        if encoder.wait() != 0:
+            raise subprocess.CalledProcessError(encoder.returncode, command)
 
 
 @retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
-@rate_limit_per_minute(max_requests_per_minute=20)
-def process_line_google(config: PodcastConfig, text: str, speaker: str):
+def process_line_google(
+        config: PodcastConfig,
+        text: str,
+        speaker: str,
+        output_file: str,
+        audio_format: str = 'mp3') -> str:
     """
     Process a single line of text using Google Text-to-Speech API.
 
@@ -117,80 +446,198 @@ def process_line_google(config: PodcastConfig, text: str, speaker: str):
     conversation flow.
 
     Args:
+        config (PodcastConfig): Configuration object containing API keys and settings
         text (str): The text content to convert to speech
         speaker (str): Speaker identifier to determine voice selection
+        output_file (str): Path where the synthesized audio should be written
+        audio_format (str): Audio format to write, 'mp3' or 'ogg' for Ogg Opus
 
     Returns:
-        bytes: Raw audio data in bytes format containing the synthesized speech
+        str: Path to the audio file containing the synthesized speech
     """
-    client = texttospeech.TextToSpeechClient(client_options={'api_key': config.google_api_key})
-    tts_settings = config.tts_settings['google']
-    
-    interviewer_voice = texttospeech.VoiceSelectionParams(
-        language_code=tts_settings['language_code'],
-        name=tts_settings['voice_mapping']['Interviewer'],
-        ssml_gender=texttospeech.SsmlVoiceGender.FEMALE
-    )
-    
-    interviewee_voice = texttospeech.VoiceSelectionParams(
-        language_code=tts_settings['language_code'],
-        name=tts_settings['voice_mapping']['Interviewee'],
-        ssml_gender=texttospeech.SsmlVoiceGender.MALE
+    _rate_limiter(config, 'google').acquire()
+
+    client, interviewer_voice, interviewee_voice, audio_config = _google_static(
+        config.google_api_key,
+        _as_tuple(config.tts_settings['google']),
+        audio_format
     )
     
     synthesis_input = texttospeech.SynthesisInput(text=text)
-    voice = interviewee_voice
-    if speaker == 'Interviewer':
-        voice = interviewer_voice
-    
-    # Select the type of audio file you want returned
-    audio_config = texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.MP3,
-        effects_profile_id=tts_settings['effects_profile_id']
-    )
+    voice = interviewer_voice if speaker == 'Interviewer' else interviewee_voice
     
     # Perform the text-to-speech request on the text input with the selected
     # voice parameters and audio file type
     response = client.synthesize_speech(
         input=synthesis_input, voice=voice, audio_config=audio_config
     )
-    
-    return response.audio_content
+
+    with open(output_file, "wb") as out:
+        out.write(response.audio_content)
+
+    return output_file
 
 
 @retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
-@rate_limit_per_minute(max_requests_per_minute=20)
-def process_line_elevenlabs(config: PodcastConfig, text: str, speaker: str):
+def process_line_elevenlabs(config: PodcastConfig, text: str, speaker: str, output_file: str) -> str:
     """
     Process a line of text into speech using ElevenLabs TTS service.
 
     Takes a line of text and speaker identifier and generates synthesized speech using
-    ElevenLabs' TTS service. Uses different voices based on the speaker to create natural
-    conversation flow.
+    ElevenLabs' streaming TTS endpoint. Audio chunks are written to disk as they arrive
+    rather than buffered in memory. Uses different voices based on the speaker to create
+    natural conversation flow.
 
     Args:
         config (PodcastConfig): Configuration object containing API keys and settings
         text (str): The text content to convert to speech
         speaker (str): Speaker identifier to determine voice selection
+        output_file (str): Path where the synthesized audio should be written
 
     Returns:
-        bytes: Raw audio data in bytes format containing the synthesized speech
+        str: Path to the audio file containing the synthesized speech
     """
-    client = elevenlabs_client.ElevenLabs(api_key=config.elevenlabs_api_key)
+    _rate_limiter(config, 'elevenlabs').acquire()
+
+    client = _get_elevenlabs_client(config.elevenlabs_api_key)
     tts_settings = config.tts_settings['elevenlabs']
 
     audio = client.generate(
         text=text,
         voice=tts_settings['voice_mapping'][speaker],
-        model=tts_settings['model']
+        model=tts_settings['model'],
+        stream=True
     )
 
-    # Convert audio iterator to bytes that can be written to disk
-    audio_bytes = BytesIO()
-    for chunk in audio:
-        audio_bytes.write(chunk)
-    
-    return audio_bytes.getvalue()
+    # Opening in "wb" truncates any partial output left by a failed attempt. The large
+    # buffer batches the small streamed chunks into a few write() syscalls.
+    with open(output_file, "wb", buffering=_STREAM_WRITE_BUFFER_SIZE) as out:
+        for chunk in audio:
+            out.write(chunk)
+
+    return output_file
+
+
+def _speaker_voice(provider: str, voice_mapping: dict, speaker: str) -> str:
+    """
+    Get the voice a provider synthesizes a speaker's lines with.
+
+    Speaker labels come from the LLM and are not guaranteed to match the voice mapping.
+    Google voices every speaker other than the interviewer with the interviewee voice,
+    while the other providers look the speaker up in their mapping directly.
+
+    Args:
+        provider (str): TTS provider name
+        voice_mapping (dict): Provider voice mapping from config.tts_settings
+        speaker (str): Speaker identifier
+
+    Returns:
+        str: Voice name used by the provider
+    """
+    if provider == 'google':
+        return voice_mapping['Interviewer' if speaker == 'Interviewer' else 'Interviewee']
+    return voice_mapping[speaker]
+
+
+def _cache_key(provider: str, settings: dict, lines: List[dict]) -> str:
+    """
+    Build a content-addressed cache key for synthesized audio.
+
+    The key covers everything that affects the generated audio: the provider, the voice
+    assigned to each speaker and the text they speak, and the remaining provider settings
+    (model, language, effects profile).
+
+    Args:
+        provider (str): TTS provider name
+        settings (dict): Provider settings from config.tts_settings
+        lines (List[dict]): Conversation lines synthesized together, each with 'speaker'
+            and 'text' keys
+
+    Returns:
+        str: Hex-encoded SHA-256 digest identifying the audio
+    """
+    turns = tuple(
+        (_speaker_voice(provider, settings['voice_mapping'], line['speaker']), line['text'])
+        for line in lines
+    )
+    other_settings = tuple(item for item in _as_tuple(settings) if item[0] != 'voice_mapping')
+    return hashlib.sha256(repr((provider, turns, other_settings)).encode()).hexdigest()
+
+
+def _synthesize_cached(
+        config: PodcastConfig,
+        provider: str,
+        lines: List[dict],
+        cache_dir: Path,
+        staging_dir: Path,
+        audio_format: str) -> str:
+    """
+    Synthesize conversation lines, reusing previously generated audio when available.
+
+    Audio is stored on disk under cache_dir keyed by _cache_key(), so identical lines
+    (intros, outros, reruns after script edits) skip the TTS request entirely. Providers
+    write new entries into staging_dir, and finished files are atomically renamed into the
+    cache so that concurrent workers never observe a partially written file.
+
+    Args:
+        config (PodcastConfig): Configuration object containing API keys and settings
+        provider (str): TTS provider to use ('google', 'elevenlabs' or 'google_multispeaker')
+        lines (List[dict]): Lines to synthesize together. Single-voice providers take
+            exactly one line, the multi-speaker provider takes a chunk of turns.
+        cache_dir (Path): Directory holding cached audio
+        staging_dir (Path): Directory for in-progress audio, on the same filesystem as cache_dir
+        audio_format (str): Format of the audio returned by the provider
+
+    Returns:
+        str: Path to the cached audio file containing the synthesized speech
+    """
+    cache_file = cache_dir / f"{_cache_key(provider, config.tts_settings[provider], lines)}.{audio_format}"
+    if cache_file.exists():
+        logger.info(f"Using cached audio {cache_file.name}")
+        # Mark the entry as recently used so _prune_audio_cache() evicts it last
+        cache_file.touch()
+        return str(cache_file)
+
+    temp_file = staging_dir / f"{cache_file.name}.{threading.get_ident()}"
+    if provider == 'google':
+        process_line_google(config, lines[0]['text'], lines[0]['speaker'], str(temp_file), audio_format)
+    elif provider == 'elevenlabs':
+        process_line_elevenlabs(config, lines[0]['text'], lines[0]['speaker'], str(temp_file))
+    elif provider == 'google_multispeaker':
+        process_lines_google_multispeaker(config, lines, str(temp_file), audio_format)
+    else:
+        raise ValueError(f"The TTS provider value '{provider}' is not supported.")
+
+    os.replace(temp_file, cache_file)
+
+    return str(cache_file)
+
+
+def _prune_audio_cache(cache_dir: Path, max_size_mb: int) -> None:
+    """
+    Evict the least recently used cached audio until the cache fits its size cap.
+
+    Args:
+        cache_dir (Path): Directory holding cached audio
+        max_size_mb (int): Maximum total size of the cache in megabytes
+    """
+    max_bytes = max_size_mb * 1024 * 1024
+    entries = sorted(
+        ((entry.stat(), entry) for entry in cache_dir.iterdir() if entry.is_file()),
+        key=lambda item: item[0].st_mtime,
+        reverse=True
+    )
+
+    total = 0
+    evicted = 0
+    for stat, entry in entries:
+        total += stat.st_size
+        if total > max_bytes:
+            entry.unlink(missing_ok=True)
+            evicted += 1
+
+    if evicted:
+        logger.info(f"Evicted {evicted} files from the audio cache")
 
 
 def combine_consecutive_speaker_chunks(chunks: List[dict]) -> List[dict]:
@@ -227,8 +674,11 @@ def combine_consecutive_speaker_chunks(chunks: List[dict]) -> List[dict]:
 
 
 @retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
-@rate_limit_per_minute(max_requests_per_minute=20)
-def process_lines_google_multispeaker(config: PodcastConfig, chunks: List):
+def process_lines_google_multispeaker(
+        config: PodcastConfig,
+        chunks: List,
+        output_file: str,
+        audio_format: str = 'mp3') -> str:
     """
     Process multiple lines of text into speech using Google's multi-speaker TTS service.
 
@@ -243,11 +693,15 @@ def process_lines_google_multispeaker(config: PodcastConfig, chunks: List):
                 'speaker': str,  # Speaker identifier
                 'text': str      # Line content to convert to speech
             }
+        output_file (str): Path where the synthesized audio should be written
+        audio_format (str): Audio format to write, 'mp3' or 'ogg' for Ogg Opus
 
     Returns:
-        bytes: Raw audio data in bytes format containing the synthesized speech
+        str: Path to the audio file containing the synthesized speech
     """
-    client = texttospeech_v1beta1.TextToSpeechClient(client_options={'api_key': config.google_api_key})
+    _rate_limiter(config, 'google_multispeaker').acquire()
+
+    client = _get_google_multispeaker_client(config.google_api_key)
     tts_settings = config.tts_settings['google_multispeaker']
 
     # Combine consecutive lines from same speaker
@@ -276,7 +730,11 @@ def process_lines_google_multispeaker(config: PodcastConfig, chunks: List):
 
     # Configure audio output
     audio_config = texttospeech_v1beta1.AudioConfig(
-        audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3_64_KBPS,
+        audio_encoding=(
+            texttospeech_v1beta1.AudioEncoding.OGG_OPUS
+            if audio_format == 'ogg'
+            else texttospeech_v1beta1.AudioEncoding.MP3_64_KBPS
+        ),
         effects_profile_id=tts_settings['effects_profile_id']
     )
 
@@ -287,7 +745,10 @@ def process_lines_google_multispeaker(config: PodcastConfig, chunks: List):
         audio_config=audio_config
     )
 
-    return response.audio_content
+    with open(output_file, "wb") as out:
+        out.write(response.audio_content)
+
+    return output_file
 
 
 def convert_to_speech(
@@ -300,7 +761,11 @@ def convert_to_speech(
     Convert a conversation script to speech audio using Google Text-to-Speech API.
 
     Takes a conversation script consisting of speaker/text pairs and generates audio files
-    for each line using Google's TTS service. The individual audio files are then merged
+    for each line using Google's TTS service. Lines (or chunks of four lines for the
+    multi-speaker provider) are synthesized concurrently, up to config.tts_concurrency
+    requests at a time, into the audio cache under temp_audio_dir, which is capped at
+    config.tts_cache_size_mb. When the cap is 0 the cache is disabled and line audio only
+    lives for the duration of the call. The audio files are then merged in script order
     into a single output file. Uses different voices for different speakers to create a
     natural conversational feel.
 
@@ -311,65 +776,124 @@ def convert_to_speech(
                 'text': str      # Line content to convert to speech
             }
         output_file (str): Path where the final merged audio file should be saved
-        temp_audio_dir (str): Directory path for temporary audio file storage
+        temp_audio_dir (str): Directory path for temporary audio file storage, including the
+            synthesized audio cache
         audio_format (str): Format of the audio files (e.g. 'mp3')
 
     Raises:
+        ValueError: If the conversation has no lines with text to synthesize, or the 'multi'
+            provider mapping is missing, incomplete or names an unsupported provider
         Exception: If any errors occur during TTS conversion or file operations
     """
-    tts_audio_formats = {
-        'elevenlabs': 'mp3',
-        'google': 'mp3',
-        'google_multispeaker': 'mp3'
-    }
+    # Empty lines would cost a TTS request for no audio
+    conversation = [line for line in conversation if line['text'].strip()]
+    if not conversation:
+        raise ValueError('The conversation has no lines with text to convert to speech.')
+    if config.tts_provider == 'multi':
+        _check_provider_mapping(config, conversation)
+    logger.info(f"Generating audio files for {len(conversation)} lines...")
+
+    if config.tts_provider == 'google_multispeaker':
+        # We will not use a line by line strategy. 
+        # Instead we will process in chunks of 4 lines.
+        chunks = [conversation[start:start + 4] for start in range(0, len(conversation), 4)]
+    else:
+        chunks = [[line] for line in conversation]
+
+    providers = [_line_provider(config, chunk[0]['speaker']) for chunk in chunks]
+
+    cache_enabled = config.tts_cache_size_mb > 0
+    cache_dir = Path(temp_audio_dir) / 'cache'
+    Path(temp_audio_dir).mkdir(parents=True, exist_ok=True)
+    if cache_enabled:
+        cache_dir.mkdir(exist_ok=True)
+
+    # Partially written audio lives in a per-run directory that is removed even when
+    # synthesis fails; completed files are moved into the cache and merged from there.
+    with tempfile.TemporaryDirectory(dir=temp_audio_dir) as staging_dir:
+        staging_dir = Path(staging_dir)
+        # Without the cache, finished lines stay in the staging directory and are
+        # removed with it once the podcast has been merged.
+        line_dir = cache_dir if cache_enabled else staging_dir
+
+        def synthesize_chunk(index: int, chunk: List[dict]) -> str:
+            logger.info(f"Generating audio for chunk {index} with {len(chunk)} lines...")
+            provider = providers[index]
+            return _synthesize_cached(
+                config,
+                provider,
+                chunk,
+                line_dir,
+                staging_dir,
+                _tts_audio_format(provider, audio_format)
+            )
+
+        # Chunks are independent network-bound requests, so overlap them and
+        # restore the script order once every chunk has been synthesized.
+        files_by_index = {}
+        with ThreadPoolExecutor(max_workers=max(1, config.tts_concurrency)) as executor:
+            futures = {
+                executor.submit(synthesize_chunk, index, chunk): index
+                for index, chunk in enumerate(chunks)
+            }
+            try:
+                for future in as_completed(futures):
+                    files_by_index[futures[future]] = future.result()
+            except Exception:
+                # The podcast cannot be assembled without every chunk, so stop paying
+                # for requests that have not started yet.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
-    try:
-        logger.info(f"Generating audio files for {len(conversation)} lines...")
-        audio_files = []
-        counter = 0
-
-        if config.tts_provider == 'google_multispeaker':
-            # We will not use a line by line strategy. 
-            # Instead we will process in chunks of 6.
-            # Process conversation in chunks of 6 lines
-            for chunk_start in range(0, len(conversation), 4):
-                chunk = conversation[chunk_start:chunk_start + 4]
-                logger.info(f"Processing chunk {counter} with {len(chunk)} lines...")
-                
-                audio = process_lines_google_multispeaker(config, chunk)
-                
-                file_name = os.path.join(temp_audio_dir, f"{counter:03d}.{tts_audio_formats[config.tts_provider]}")
-                with open(file_name, "wb") as out:
-                    out.write(audio)
-                audio_files.append(file_name)
-                
-                counter += 1
-        else:
-            for line in conversation:
-                logger.info(f"Generating audio for line {counter}...")
+        audio_files = [files_by_index[index] for index in sorted(files_by_index)]
 
-                if config.tts_provider == 'google':
-                    audio = process_line_google(config, line['text'], line['speaker'])
-                elif config.tts_provider == 'elevenlabs':
-                    audio = process_line_elevenlabs(config, line['text'], line['speaker'])
+        # Providers encode at different sample rates, so their streams cannot be
+        # concatenated as is when the multi provider mixes them.
+        merge_audio_files(audio_files, output_file, audio_format, reencode=len(set(providers)) > 1)
 
-                logger.info(f"Saving audio chunk {counter}...")
-                file_name = os.path.join(temp_audio_dir, f"{counter:03d}.{tts_audio_formats[config.tts_provider]}")
-                with open(file_name, "wb") as out:
-                    out.write(audio)
-                audio_files.append(file_name)
+    if cache_enabled:
+        _prune_audio_cache(cache_dir, config.tts_cache_size_mb)
 
-                counter += 1
 
-        # Merge all audio files and save the result
-        merge_audio_files(audio_files, output_file, audio_format)
+def _warm_up_tts_client(config: PodcastConfig, provider: str) -> None:
+    """
+    Open a TTS provider connection ahead of the first synthesis request.
 
-        # Clean up individual audio files
-        for file in audio_files:
-            os.remove(file)
+    Clients connect lazily, so the first line of every podcast would otherwise pay for the
+    TLS and HTTP/2 handshakes. Issues a cheap voice listing request on the cached client and
+    discards the result. The request is bounded by a short timeout and never retried, and
+    failures are only logged since synthesis retries on its own.
 
+    Args:
+        config (PodcastConfig): Configuration object containing API keys and settings
+        provider (str): TTS provider to connect to
+    """
+    try:
+        if provider == 'google':
+            tts_settings = config.tts_settings['google']
+            client = _google_static(
+                config.google_api_key,
+                _as_tuple(tts_settings),
+                _tts_audio_format('google', config.output_format)
+            )[0]
+            client.list_voices(
+                language_code=tts_settings['language_code'],
+                retry=None,
+                timeout=_WARM_UP_TIMEOUT
+            )
+        elif provider == 'google_multispeaker':
+            client = _get_google_multispeaker_client(config.google_api_key)
+            client.list_voices(
+                language_code=config.tts_settings['google_multispeaker']['language_code'],
+                retry=None,
+                timeout=_WARM_UP_TIMEOUT
+            )
+        elif provider == 'elevenlabs':
+            _get_elevenlabs_client(config.elevenlabs_api_key).voices.get_all(
+                request_options={'timeout_in_seconds': _WARM_UP_TIMEOUT, 'max_retries': 0}
+            )
     except Exception as e:
-        raise
+        logger.warning(f"Failed to warm up {provider} TTS client: {str(e)}")
 
 
 def generate_audio(config: PodcastConfig, final_script: list, output_file: str) -> str:
@@ -394,10 +918,22 @@ def generate_audio(config: PodcastConfig, final_script: list, output_file: str)
     Raises:
         Exception: If any errors occur during TTS conversion or file operations
     """
+    providers = {config.tts_provider}
+    if config.tts_provider == 'multi':
+        providers = set(config.tts_settings['multi']['provider_mapping'].values())
+
+    # Connect to the TTS providers in the background. Synthesis does not wait for the
+    # warm-up requests; it only shares the clients they have started connecting.
+    executor = ThreadPoolExecutor(max_workers=len(providers))
+    for provider in providers:
+        executor.submit(_warm_up_tts_client, config, provider)
+    executor.shutdown(wait=False)
+
     cleaned_script = clean_text_for_tts(final_script)
 
     temp_audio_dir = Path(config.temp_audio_dir)
     temp_audio_dir.mkdir(parents=True, exist_ok=True)
+
     convert_to_speech(config, cleaned_script, output_file, config.temp_audio_dir, config.output_format)
 
     return output_file
@@ -1,4 +1,6 @@
 import logging
+import random
+import threading
 import time
 from functools import wraps
 
@@ -6,6 +8,44 @@ from functools import wraps
 logger = logging.getLogger(__name__)
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket enforcing a per-minute request budget.
+
+    The bucket holds up to max_requests_per_minute tokens and refills continuously at
+    max_requests_per_minute / 60 tokens per second. Each call to acquire() consumes one
+    token, blocking until one is available, so a single limiter can be shared by any
+    number of worker threads without exceeding the quota.
+
+    Args:
+        max_requests_per_minute (int): Maximum number of requests allowed per minute
+    """
+    def __init__(self, max_requests_per_minute: int):
+        self.capacity = float(max_requests_per_minute)
+        self.tokens = float(max_requests_per_minute)
+        self.refill_rate = max_requests_per_minute / 60.0  # Tokens per second
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until a request token is available and consume it.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+
+            if self.tokens < 1:
+                # Sleep while holding the lock so waiting threads queue up in order
+                # instead of all waking at once and racing for the same token.
+                time.sleep((1 - self.tokens) / self.refill_rate)
+                self.tokens = 1.0
+                self.last_refill = time.monotonic()
+
+            self.tokens -= 1
+
+
 def rate_limit_per_minute(max_requests_per_minute: int):
     """
     Decorator that adds per-minute rate limiting to a function.
@@ -17,33 +57,28 @@ def rate_limit_per_minute(max_requests_per_minute: int):
         Callable: Decorated function with rate limiting
     """
     def decorator(func):
-        last_request_time = 0
-        min_interval = 60.0 / max_requests_per_minute  # Time between requests in seconds
+        limiter = RateLimiter(max_requests_per_minute)
         
         @wraps(func)
         def wrapper(*args, **kwargs):
-            nonlocal last_request_time
-            current_time = time.time()
-            time_since_last = current_time - last_request_time
-            
-            if time_since_last < min_interval:
-                sleep_time = min_interval - time_since_last
-                time.sleep(sleep_time)
-                
-            last_request_time = time.time()
+            limiter.acquire()
             return func(*args, **kwargs)
             
         return wrapper
     return decorator
 
 
-def retry_with_exponential_backoff(max_retries: int, base_delay: float = 1.0):
+def retry_with_exponential_backoff(max_retries: int, base_delay: float = 1.0, max_delay: float = 60.0):
     """
     Decorator that retries a function with exponential backoff when exceptions occur.
+
+    Uses "full jitter": each retry sleeps a random time between zero and the current
+    backoff ceiling, so concurrent callers that fail together do not retry in lockstep.
     
     Args:
         max_retries (int): Maximum number of retry attempts
         base_delay (float): Initial delay between retries in seconds. Will be exponentially increased.
+        max_delay (float): Upper bound in seconds for the backoff ceiling
         
     Returns:
         Callable: Decorated function with retry logic
@@ -68,13 +103,14 @@ def retry_with_exponential_backoff(max_retries: int, base_delay: float = 1.0):
                     if attempt == max_retries:
                         raise last_exception
                     
+                    sleep_time = random.uniform(0, delay)
                     logger.warning(
                         f'Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}. '
-                        f'Retrying in {delay:.1f}s...'
+                        f'Retrying in {sleep_time:.1f}s...'
                     )
                     logger.warning(f"Caught exception: {str(e)}")
-                    time.sleep(delay)
-                    delay *= 2  # Exponential backoff
+                    time.sleep(sleep_time)
+                    delay = min(delay * 2, max_delay)  # Exponential backoff
                     
             return None  # Should never reach here
         return wrapper
@@ -1,6 +1,10 @@
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock, patch, mock_open
 import os
+import subprocess
+import threading
+import time
 from pathlib import Path
 from pydub import AudioSegment
 from google.cloud import texttospeech
@@ -11,7 +15,15 @@ from podcast_llm.text_to_speech import (
     process_line_google,
     generate_audio,
     rate_limit_per_minute,
-    combine_consecutive_speaker_chunks
+    combine_consecutive_speaker_chunks,
+    convert_to_speech,
+    _prune_audio_cache,
+    _thread_safe_cache,
+    _tts_audio_format,
+    _rate_limiter,
+    process_line_elevenlabs,
+    _get_elevenlabs_client,
+    _google_static
 )
 
 # Test data
@@ -20,6 +32,11 @@ SAMPLE_LINES = [
     {'speaker': 'Interviewee', 'text': 'Hi there *friend*!'}
 ]
 
+RATE_LIMITS = {
+    'google': {'requests_per_minute': 600},
+    'elevenlabs': {'requests_per_minute': 600}
+}
+
 CLEANED_LINES = [
     {'speaker': 'Interviewer', 'text': 'Hello world with emphasis anddash'},
     {'speaker': 'Interviewee', 'text': 'Hi there friend!'}
@@ -28,8 +45,11 @@ CLEANED_LINES = [
 @pytest.fixture
 def mock_audio_segment():
     with patch('podcast_llm.text_to_speech.AudioSegment') as mock:
-        mock.empty.return_value = Mock()
-        mock.from_file.return_value = Mock()
+        mock.empty.return_value = MagicMock()
+        mock.from_file.return_value = MagicMock()
+        mock.from_mp3.return_value = MagicMock()
+        normalized = mock.from_mp3.return_value.set_channels.return_value.set_frame_rate.return_value
+        normalized.set_sample_width.return_value.raw_data = b'pcm'
         yield mock
 
 @pytest.fixture
@@ -38,7 +58,28 @@ def mock_tts_client():
         mock_instance = Mock()
         mock_instance.synthesize_speech.return_value = Mock(audio_content=b'fake_audio')
         mock.return_value = mock_instance
+        _google_static.cache_clear()
         yield mock_instance
+        _google_static.cache_clear()
+
+@pytest.fixture
+def google_config():
+    return Mock(
+        google_api_key='test-key',
+        output_format='mp3',
+        tts_cache_size_mb=100,
+        rate_limits=RATE_LIMITS,
+        tts_settings={
+            'google': {
+                'voice_mapping': {
+                    'Interviewer': 'en-US-Journey-F',
+                    'Interviewee': 'en-US-Journey-D'
+                },
+                'language_code': 'en-US',
+                'effects_profile_id': 'small-bluetooth-speaker-class-device'
+            }
+        }
+    )
 
 
 def test_clean_text_for_tts():
@@ -46,6 +87,23 @@ def test_clean_text_for_tts():
     result = clean_text_for_tts(SAMPLE_LINES)
     assert result == CLEANED_LINES
 
+def test_clean_text_for_tts_keeps_lines_separate():
+    """Test that lines stay aligned with their speakers, even if they contain the separator"""
+    assert clean_text_for_tts([]) == []
+
+    lines = SAMPLE_LINES + [{'speaker': 'Interviewer', 'text': 'odd\x00_text_'}]
+    assert clean_text_for_tts(lines) == CLEANED_LINES + [{'speaker': 'Interviewer', 'text': 'odd\x00text'}]
+
+def test_clean_text_for_tts_drops_empty_lines():
+    """Test that lines with nothing left to speak after cleaning are removed"""
+    lines = [
+        {'speaker': 'Interviewer', 'text': '***'},
+        SAMPLE_LINES[0],
+        {'speaker': 'Interviewee', 'text': ' _ — '},
+        SAMPLE_LINES[1]
+    ]
+    assert clean_text_for_tts(lines) == CLEANED_LINES
+
 def test_combine_consecutive_speaker_chunks():
     # Test case 1: Empty list
     assert combine_consecutive_speaker_chunks([]) == []
@@ -114,3 +172,563 @@ def test_combine_consecutive_speaker_chunks_empty_text():
     ]
     assert combine_consecutive_speaker_chunks(chunks) == expected
 
+
+def test_convert_to_speech_preserves_line_order(tmp_path, google_config):
+    """Test that concurrently synthesized lines are merged in script order"""
+    config = google_config
+    config.tts_provider = 'google'
+    config.tts_concurrency = 4
+    conversation = [{'speaker': 'Interviewer', 'text': f'Line {i}'} for i in range(6)]
+
+    def fake_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        Path(output_file).write_text(text)
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.process_line_google', side_effect=fake_process_line), \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        convert_to_speech(config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    audio_files = mock_merge.call_args[0][0]
+    assert [Path(f).read_text() for f in audio_files] == [f'Line {i}' for i in range(6)]
+
+
+def test_process_line_google_reuses_client(mock_tts_client, google_config, tmp_path):
+    """Test that the Google TTS client and request parameters are built once and reused"""
+    output_file = str(tmp_path / 'line.mp3')
+    assert process_line_google(google_config, 'Hello', 'Interviewer', output_file) == output_file
+    assert process_line_google(google_config, 'Hi', 'Interviewee', output_file) == output_file
+    assert Path(output_file).read_bytes() == b'fake_audio'
+
+    texttospeech.TextToSpeechClient.assert_called_once_with(client_options={'api_key': 'test-key'})
+    calls = mock_tts_client.synthesize_speech.call_args_list
+    assert [c.kwargs['voice'].name for c in calls] == ['en-US-Journey-F', 'en-US-Journey-D']
+    assert calls[0].kwargs['audio_config'] is calls[1].kwargs['audio_config']
+
+
+def test_convert_to_speech_reuses_cached_audio(tmp_path, google_config):
+    """Test that repeated lines are served from the on-disk audio cache"""
+    google_config.tts_provider = 'google'
+    google_config.tts_concurrency = 2
+    conversation = [
+        {'speaker': 'Interviewer', 'text': 'Welcome to the show'},
+        {'speaker': 'Interviewee', 'text': 'Welcome to the show'},
+        {'speaker': 'Interviewer', 'text': 'Welcome to the show'}
+    ]
+
+    def fake_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        Path(output_file).write_text(speaker)
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.process_line_google', side_effect=fake_process_line) as mock_process, \
+         patch('podcast_llm.text_to_speech.merge_audio_files'):
+        convert_to_speech(google_config, conversation[:2], 'output.mp3', str(tmp_path), 'mp3')
+        convert_to_speech(google_config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    # Different voices are cached separately, but each (voice, text) pair is synthesized once
+    assert mock_process.call_count == 2
+    assert len(list((tmp_path / 'cache').glob('*.mp3'))) == 2
+
+
+def test_merge_audio_files_stream_copies_matching_formats(tmp_path):
+    """Test that inputs already in the output format are concatenated without re-encoding"""
+    audio_files = [str(tmp_path / '000.mp3'), str(tmp_path / "it's.mp3")]
+    concat_lists = []
+
+    def fake_run(args, check):
+        with open(args[args.index('-i') + 1]) as f:
+            concat_lists.append(f.read())
+
+    with patch('podcast_llm.text_to_speech.subprocess.run', side_effect=fake_run) as mock_run:
+        merge_audio_files(audio_files, 'output.mp3', 'mp3')
+
+    args = mock_run.call_args[0][0]
+    assert args[-3:] == ['-c', 'copy', 'output.mp3']
+    assert concat_lists == [
+        f"file '{tmp_path}/000.mp3'\n"
+        f"file '{tmp_path}/it'\\''s.mp3'\n"
+    ]
+
+
+def test_merge_audio_files_reencodes_other_formats(mock_audio_segment):
+    """Test that merging into a different format streams decoded PCM into one encoder"""
+    mock_audio_segment.converter = 'ffmpeg'
+
+    with patch('podcast_llm.text_to_speech.subprocess.run') as mock_run, \
+         patch('podcast_llm.text_to_speech.subprocess.Popen') as mock_popen:
+        encoder = mock_popen.return_value.__enter__.return_value
+        encoder.wait.return_value = 0
+        merge_audio_files(['000.mp3', '001.mp3'], 'output.wav', 'wav')
+
+    mock_run.assert_not_called()
+    assert mock_audio_segment.from_mp3.call_count == 2
+    segment = mock_audio_segment.from_mp3.return_value
+    segment.set_channels.assert_called_with(1)
+    segment.set_channels.return_value.set_frame_rate.assert_called_with(24000)
+
+    command = mock_popen.call_args[0][0]
+    assert command[command.index('-i') - 6:command.index('-i') + 2] == [
+        '-f', 's16le', '-ar', '24000', '-ac', '1', '-i', 'pipe:0'
+    ]
+    assert command[-3:] == ['-f', 'wav', 'output.wav']
+    assert [c.args[0] for c in encoder.stdin.write.call_args_list] == [b'pcm', b'pcm']
+    encoder.stdin.close.assert_called_once()
+
+
+def test_merge_audio_files_reencodes_when_requested(mock_audio_segment):
+    """Test that matching formats are decoded and re-encoded when stream copy is ruled out"""
+    mock_audio_segment.converter = 'ffmpeg'
+
+    with patch('podcast_llm.text_to_speech.subprocess.run') as mock_run, \
+         patch('podcast_llm.text_to_speech.subprocess.Popen') as mock_popen:
+        encoder = mock_popen.return_value.__enter__.return_value
+        encoder.wait.return_value = 0
+        merge_audio_files(['000.mp3', '001.mp3'], 'output.mp3', 'mp3', reencode=True)
+
+    mock_run.assert_not_called()
+    command = mock_popen.call_args[0][0]
+    assert command[-3:] == ['-f', 'mp3', 'output.mp3']
+    assert [c.args[0] for c in encoder.stdin.write.call_args_list] == [b'pcm', b'pcm']
+
+
+def test_merge_audio_files_raises_when_encoder_fails(mock_audio_segment):
+    """Test that a failing ffmpeg encoder surfaces as an error"""
+    with patch('podcast_llm.text_to_speech.subprocess.Popen') as mock_popen:
+        mock_popen.return_value.__enter__.return_value.wait.return_value = 1
+        with pytest.raises(subprocess.CalledProcessError):
+            merge_audio_files(['000.mp3'], 'output.wav', 'wav')
+
+
+def test_merge_audio_files_rejects_empty_input(tmp_path):
+    """Test that merging no audio files raises a clear error instead of invoking ffmpeg"""
+    with patch('podcast_llm.text_to_speech.subprocess.Popen') as mock_popen, \
+         patch('podcast_llm.text_to_speech.subprocess.run') as mock_run:
+        with pytest.raises(ValueError, match='No audio files'):
+            merge_audio_files([], str(tmp_path / 'output.mp3'), 'mp3')
+
+    mock_popen.assert_not_called()
+    mock_run.assert_not_called()
+
+
+def test_process_line_elevenlabs_streams_chunks_to_file(tmp_path):
+    """Test that ElevenLabs audio chunks are written to disk as they are streamed"""
+    config = Mock(
+        elevenlabs_api_key='test-key',
+        rate_limits=RATE_LIMITS,
+        tts_settings={'elevenlabs': {'voice_mapping': {'Interviewer': 'Chris'}, 'model': 'eleven_multilingual_v2'}}
+    )
+    output_file = str(tmp_path / 'line.mp3')
+
+    with patch('podcast_llm.text_to_speech.elevenlabs_client.ElevenLabs') as mock_client_class:
+        mock_client_class.return_value.generate.return_value = iter([b'chunk1', b'chunk2'])
+        _get_elevenlabs_client.cache_clear()
+        result = process_line_elevenlabs(config, 'Hello', 'Interviewer', output_file)
+        _get_elevenlabs_client.cache_clear()
+
+    assert result == output_file
+    assert Path(output_file).read_bytes() == b'chunk1chunk2'
+    assert mock_client_class.return_value.generate.call_args.kwargs['stream'] is True
+
+
+def test_convert_to_speech_multispeaker_chunks(tmp_path):
+    """Test that the multi-speaker provider synthesizes chunks of four lines in order"""
+    config = Mock(
+        tts_provider='google_multispeaker',
+        tts_concurrency=2,
+        tts_cache_size_mb=100,
+        rate_limits=RATE_LIMITS,
+        tts_settings={
+            'google_multispeaker': {
+                'voice_mapping': {'Interviewer': 'R', 'Interviewee': 'S'},
+                'language_code': 'en-US',
+                'effects_profile_id': 'small-bluetooth-speaker-class-device'
+            }
+        }
+    )
+    conversation = [
+        {'speaker': 'Interviewer' if i % 2 == 0 else 'Interviewee', 'text': f'Line {i}'}
+        for i in range(10)
+    ]
+
+    def fake_process_chunk(config, chunk, output_file, audio_format):
+        Path(output_file).write_text(','.join(line['text'] for line in chunk))
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.process_lines_google_multispeaker',
+               side_effect=fake_process_chunk) as mock_process, \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        convert_to_speech(config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    assert mock_process.call_count == 3
+    audio_files = mock_merge.call_args[0][0]
+    assert [Path(f).read_text() for f in audio_files] == [
+        'Line 0,Line 1,Line 2,Line 3',
+        'Line 4,Line 5,Line 6,Line 7',
+        'Line 8,Line 9'
+    ]
+
+
+def test_convert_to_speech_cancels_pending_lines_on_failure(tmp_path, google_config):
+    """Test that a failed line cancels lines that have not been submitted to the provider"""
+    google_config.tts_provider = 'google'
+    google_config.tts_concurrency = 1
+    conversation = [{'speaker': 'Interviewer', 'text': f'Line {i}'} for i in range(5)]
+    cancelled = threading.Event()
+    sent = []
+
+    class ObservedExecutor(ThreadPoolExecutor):
+        def shutdown(self, wait=True, *, cancel_futures=False):
+            super().shutdown(wait=False, cancel_futures=cancel_futures)
+            if cancel_futures:
+                cancelled.set()
+            if wait:
+                super().shutdown(wait=True)
+
+    def fake_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        sent.append(text)
+        if text == 'Line 0':
+            raise RuntimeError('quota exceeded')
+        # Hold the only worker until pending lines are cancelled
+        cancelled.wait(5)
+        Path(output_file).write_text(text)
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.ThreadPoolExecutor', ObservedExecutor), \
+         patch('podcast_llm.text_to_speech.process_line_google', side_effect=fake_process_line), \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        with pytest.raises(RuntimeError):
+            convert_to_speech(google_config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    assert cancelled.is_set()
+    assert sent[0] == 'Line 0'
+    assert not {'Line 2', 'Line 3', 'Line 4'} & set(sent)
+    mock_merge.assert_not_called()
+
+
+def test_convert_to_speech_removes_partial_audio_on_failure(tmp_path, google_config):
+    """Test that audio left behind by a failed line is cleaned up and never cached"""
+    google_config.tts_provider = 'google'
+    google_config.tts_concurrency = 1
+
+    def failing_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        Path(output_file).write_bytes(b'partial')
+        raise RuntimeError('connection reset')
+
+    with patch('podcast_llm.text_to_speech.process_line_google', side_effect=failing_process_line), \
+         patch('podcast_llm.text_to_speech.merge_audio_files'):
+        with pytest.raises(RuntimeError):
+            convert_to_speech(google_config, [{'speaker': 'Interviewer', 'text': 'Hello'}],
+                              'output.mp3', str(tmp_path), 'mp3')
+
+    assert [p.name for p in tmp_path.iterdir()] == ['cache']
+    assert list((tmp_path / 'cache').iterdir()) == []
+
+
+def test_generate_audio_warms_up_client_and_converts_cleaned_script(mock_tts_client, google_config, tmp_path):
+    """Test that generate_audio pre-connects the TTS client without waiting for it"""
+    google_config.tts_provider = 'google'
+    google_config.temp_audio_dir = str(tmp_path / 'audio')
+    warm_up_started = threading.Event()
+    release_warm_up = threading.Event()
+    converted_during_warm_up = []
+
+    def slow_list_voices(**kwargs):
+        warm_up_started.set()
+        release_warm_up.wait(5)
+
+    def fake_convert(*args):
+        converted_during_warm_up.append(warm_up_started.wait(5) and not release_warm_up.is_set())
+
+    mock_tts_client.list_voices.side_effect = slow_list_voices
+    with patch('podcast_llm.text_to_speech.convert_to_speech', side_effect=fake_convert) as mock_convert:
+        try:
+            assert generate_audio(google_config, SAMPLE_LINES, 'output.mp3') == 'output.mp3'
+        finally:
+            release_warm_up.set()
+
+    assert converted_during_warm_up == [True]
+    mock_tts_client.list_voices.assert_called_once_with(language_code='en-US', retry=None, timeout=5)
+    mock_convert.assert_called_once_with(google_config, CLEANED_LINES, 'output.mp3', str(tmp_path / 'audio'), 'mp3')
+    assert (tmp_path / 'audio').is_dir()
+
+
+def test_tts_audio_format():
+    """Test that Ogg Opus is requested only from providers that can return it"""
+    assert _tts_audio_format('google', 'ogg') == 'ogg'
+    assert _tts_audio_format('google_multispeaker', 'ogg') == 'ogg'
+    assert _tts_audio_format('elevenlabs', 'ogg') == 'mp3'
+    assert _tts_audio_format('google', 'mp3') == 'mp3'
+    assert _tts_audio_format('google', 'wav') == 'mp3'
+
+
+def test_process_line_google_requests_ogg_opus(mock_tts_client, google_config, tmp_path):
+    """Test that Google returns Ogg Opus audio when the podcast is written as Ogg"""
+    process_line_google(google_config, 'Hello', 'Interviewer', str(tmp_path / 'line.ogg'), 'ogg')
+
+    audio_config = mock_tts_client.synthesize_speech.call_args.kwargs['audio_config']
+    assert audio_config.audio_encoding == texttospeech.AudioEncoding.OGG_OPUS
+
+
+def test_convert_to_speech_skips_empty_lines(tmp_path, google_config):
+    """Test that blank lines are never sent to the TTS provider"""
+    google_config.tts_provider = 'google'
+    google_config.tts_concurrency = 2
+    conversation = [
+        {'speaker': 'Interviewer', 'text': 'Hello'},
+        {'speaker': 'Interviewee', 'text': '   '},
+        {'speaker': 'Interviewer', 'text': ''}
+    ]
+
+    def fake_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        Path(output_file).write_text(text)
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.process_line_google', side_effect=fake_process_line) as mock_process, \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        convert_to_speech(google_config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    mock_process.assert_called_once()
+    assert len(mock_merge.call_args[0][0]) == 1
+
+
+def test_convert_to_speech_rejects_all_empty_script(tmp_path, google_config):
+    """Test that a script with no text raises before any synthesis or merge"""
+    google_config.tts_provider = 'google'
+    google_config.tts_concurrency = 2
+    conversation = [
+        {'speaker': 'Interviewer', 'text': ' '},
+        {'speaker': 'Interviewee', 'text': ''}
+    ]
+
+    with patch('podcast_llm.text_to_speech.process_line_google') as mock_process, \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        with pytest.raises(ValueError, match='no lines with text'):
+            convert_to_speech(google_config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    mock_process.assert_not_called()
+    mock_merge.assert_not_called()
+
+
+def test_convert_to_speech_google_voices_unmapped_speaker_as_interviewee(tmp_path, google_config):
+    """Test that a speaker label missing from the voice mapping falls back to the interviewee voice"""
+    google_config.tts_provider = 'google'
+    google_config.tts_concurrency = 1
+    conversation = [
+        {'speaker': 'Host', 'text': 'Hello'},
+        {'speaker': 'Interviewee', 'text': 'Hello'}
+    ]
+
+    def fake_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        Path(output_file).write_text(speaker)
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.process_line_google', side_effect=fake_process_line) as mock_process, \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        convert_to_speech(google_config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    # Both lines use the same voice and text, so the second is served from the cache
+    mock_process.assert_called_once()
+    assert mock_process.call_args[0][2] == 'Host'
+    audio_files = mock_merge.call_args[0][0]
+    assert audio_files[0] == audio_files[1]
+
+
+def test_convert_to_speech_multi_provider_splits_by_speaker(tmp_path, google_config):
+    """Test that the multi provider voices each speaker with its mapped provider"""
+    google_config.tts_provider = 'multi'
+    google_config.tts_concurrency = 4
+    google_config.tts_settings['elevenlabs'] = {
+        'voice_mapping': {'Interviewer': 'Chris', 'Interviewee': 'Charlie'},
+        'model': 'eleven_multilingual_v2'
+    }
+    google_config.tts_settings['multi'] = {
+        'provider_mapping': {'Interviewer': 'google', 'Interviewee': 'elevenlabs'}
+    }
+    conversation = [
+        {'speaker': 'Interviewer', 'text': 'Question'},
+        {'speaker': 'Interviewee', 'text': 'Answer'}
+    ]
+
+    def fake_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        Path(output_file).write_text(text)
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.process_line_google', side_effect=fake_process_line) as mock_google, \
+         patch('podcast_llm.text_to_speech.process_line_elevenlabs', side_effect=fake_process_line) as mock_eleven, \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        convert_to_speech(google_config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    assert mock_google.call_args[0][1:3] == ('Question', 'Interviewer')
+    assert mock_eleven.call_args[0][1:3] == ('Answer', 'Interviewee')
+    assert [Path(f).read_text() for f in mock_merge.call_args[0][0]] == ['Question', 'Answer']
+    # Google and ElevenLabs MP3s have different sample rates and cannot be stream copied
+    assert mock_merge.call_args.kwargs['reencode'] is True
+
+
+@pytest.mark.parametrize('multi_settings, message', [
+    (None, 'requires tts_settings.multi.provider_mapping'),
+    ({'provider_mapping': {'Interviewer': 'google'}}, "speaker 'Interviewee' is missing"),
+    ({'provider_mapping': {'Interviewer': 'google', 'Interviewee': 'polly'}}, "provider 'polly'")
+])
+def test_convert_to_speech_multi_provider_rejects_bad_mapping(tmp_path, google_config, multi_settings, message):
+    """Test that an incomplete or unsupported multi provider mapping fails before synthesis"""
+    google_config.tts_provider = 'multi'
+    google_config.tts_concurrency = 2
+    if multi_settings is not None:
+        google_config.tts_settings['multi'] = multi_settings
+    conversation = [
+        {'speaker': 'Interviewer', 'text': 'Question'},
+        {'speaker': 'Interviewee', 'text': 'Answer'}
+    ]
+
+    with patch('podcast_llm.text_to_speech.process_line_google') as mock_process, \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        with pytest.raises(ValueError, match=message):
+            convert_to_speech(google_config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    mock_process.assert_not_called()
+    mock_merge.assert_not_called()
+
+
+def test_convert_to_speech_multi_provider_single_provider_stream_copies(tmp_path, google_config):
+    """Test that a multi provider script voiced by one provider keeps the stream copy merge"""
+    google_config.tts_provider = 'multi'
+    google_config.tts_concurrency = 2
+    google_config.tts_settings['multi'] = {
+        'provider_mapping': {'Interviewer': 'google', 'Interviewee': 'google'}
+    }
+    conversation = [
+        {'speaker': 'Interviewer', 'text': 'Question'},
+        {'speaker': 'Interviewee', 'text': 'Answer'}
+    ]
+
+    def fake_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        Path(output_file).write_text(text)
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.process_line_google', side_effect=fake_process_line), \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        convert_to_speech(google_config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    assert mock_merge.call_args.kwargs['reencode'] is False
+
+
+def test_rate_limiter_uses_configured_quota_per_provider(google_config):
+    """Test that limiters are sized from config and the Google providers share one quota"""
+    google_config.rate_limits = {
+        'google': {'requests_per_minute': 15},
+        'elevenlabs': {'requests_per_minute': 90}
+    }
+
+    assert _rate_limiter(google_config, 'google').capacity == 15
+    assert _rate_limiter(google_config, 'elevenlabs').capacity == 90
+    assert _rate_limiter(google_config, 'google_multispeaker') is _rate_limiter(google_config, 'google')
+
+
+def test_thread_safe_cache_builds_each_entry_once():
+    """Test that concurrent misses build an entry once and hits reuse it"""
+    calls = []
+
+    @_thread_safe_cache
+    def build(key):
+        calls.append(key)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(build('a'))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['a']
+    assert all(result is results[0] for result in results)
+
+
+def test_thread_safe_cache_miss_does_not_block_other_caches():
+    """Test that a slow build in one cache does not block lookups in another"""
+    release = threading.Event()
+
+    @_thread_safe_cache
+    def slow_build(key):
+        release.wait(5)
+        return key
+
+    @_thread_safe_cache
+    def fast_build(key):
+        return key
+
+    fast_build('b')
+    builder = threading.Thread(target=slow_build, args=('a',))
+    builder.start()
+    try:
+        done = threading.Event()
+        threading.Thread(target=lambda: (fast_build('b'), fast_build('c'), done.set())).start()
+        assert done.wait(1)
+    finally:
+        release.set()
+        builder.join()
+
+
+def test_convert_to_speech_without_cache_keeps_no_audio(tmp_path, google_config):
+    """Test that disabling the cache leaves no line audio behind after merging"""
+    google_config.tts_provider = 'google'
+    google_config.tts_concurrency = 2
+    google_config.tts_cache_size_mb = 0
+    conversation = [{'speaker': 'Interviewer', 'text': f'Line {i}'} for i in range(3)]
+    merged = []
+
+    def fake_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        Path(output_file).write_text(text)
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.process_line_google', side_effect=fake_process_line), \
+         patch('podcast_llm.text_to_speech.merge_audio_files',
+               side_effect=lambda files, *args, **kwargs: merged.extend(Path(f).read_text() for f in files)):
+        convert_to_speech(google_config, conversation, 'output.mp3', str(tmp_path), 'mp3')
+
+    assert merged == ['Line 0', 'Line 1', 'Line 2']
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_prune_audio_cache_evicts_least_recently_used(tmp_path):
+    """Test that the oldest cache entries are removed until the cache fits its cap"""
+    for age, name in enumerate(['newest', 'middle', 'oldest']):
+        entry = tmp_path / f'{name}.mp3'
+        entry.write_bytes(b'x' * 400 * 1024)
+        os.utime(entry, (time.time() - age * 60, time.time() - age * 60))
+
+    _prune_audio_cache(tmp_path, max_size_mb=1)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['middle.mp3', 'newest.mp3']
+
+
+def test_process_line_google_accepts_effects_profile_list(mock_tts_client, google_config, tmp_path):
+    """Test that a list of effects profiles, as allowed by the API, can be cached and sent"""
+    profiles = ['small-bluetooth-speaker-class-device', 'headphone-class-device']
+    google_config.tts_settings['google']['effects_profile_id'] = profiles
+
+    process_line_google(google_config, 'Hello', 'Interviewer', str(tmp_path / 'line.mp3'))
+
+    audio_config = mock_tts_client.synthesize_speech.call_args.kwargs['audio_config']
+    assert list(audio_config.effects_profile_id) == profiles
+
+
+def test_convert_to_speech_requests_the_format_it_caches(tmp_path, google_config):
+    """Test that lines are synthesized in the format named by the cache file, not config.output_format"""
+    google_config.tts_provider = 'google'
+    google_config.tts_concurrency = 1
+    google_config.output_format = 'mp3'
+
+    def fake_process_line(config, text, speaker, output_file, audio_format='mp3'):
+        Path(output_file).write_text(audio_format)
+        return output_file
+
+    with patch('podcast_llm.text_to_speech.process_line_google', side_effect=fake_process_line), \
+         patch('podcast_llm.text_to_speech.merge_audio_files') as mock_merge:
+        convert_to_speech(google_config, [{'speaker': 'Interviewer', 'text': 'Hello'}],
+                          'output.ogg', str(tmp_path), 'ogg')
+
+    audio_file = Path(mock_merge.call_args[0][0][0])
+    assert audio_file.suffix == '.ogg'
+    assert audio_file.read_text() == 'ogg'
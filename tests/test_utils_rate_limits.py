@@ -0,0 +1,74 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from podcast_llm.utils.rate_limits import RateLimiter, retry_with_exponential_backoff
+
+
+def test_rate_limiter_allows_burst_up_to_capacity():
+    """Test that a full bucket serves its capacity without sleeping"""
+    limiter = RateLimiter(max_requests_per_minute=5)
+
+    with patch('podcast_llm.utils.rate_limits.time.sleep') as mock_sleep:
+        for _ in range(5):
+            limiter.acquire()
+
+    mock_sleep.assert_not_called()
+
+
+def test_rate_limiter_sleeps_when_bucket_is_empty():
+    """Test that acquiring from an empty bucket waits for one token to refill"""
+    limiter = RateLimiter(max_requests_per_minute=60)
+    limiter.tokens = 0.0
+
+    with patch('podcast_llm.utils.rate_limits.time.sleep') as mock_sleep:
+        limiter.acquire()
+
+    mock_sleep.assert_called_once()
+    assert 0 < mock_sleep.call_args[0][0] <= 1.0
+    assert limiter.tokens < 1
+
+
+def test_rate_limiter_is_shared_safely_across_threads():
+    """Test that concurrent callers never consume more tokens than available"""
+    limiter = RateLimiter(max_requests_per_minute=10)
+
+    with patch('podcast_llm.utils.rate_limits.time.sleep') as mock_sleep:
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(15)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_sleep.call_count >= 5
+
+
+def test_retry_with_exponential_backoff_uses_capped_jitter():
+    """Test that retry delays are jittered below a doubling, capped ceiling"""
+    calls = []
+
+    @retry_with_exponential_backoff(max_retries=4, base_delay=1.0, max_delay=3.0)
+    def flaky():
+        calls.append(1)
+        if len(calls) < 5:
+            raise ValueError('transient')
+        return 'ok'
+
+    with patch('podcast_llm.utils.rate_limits.random.uniform', side_effect=lambda low, high: high) as mock_uniform, \
+         patch('podcast_llm.utils.rate_limits.time.sleep') as mock_sleep:
+        assert flaky() == 'ok'
+
+    assert [c.args for c in mock_uniform.call_args_list] == [(0, 1.0), (0, 2.0), (0, 3.0), (0, 3.0)]
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 3.0, 3.0]
+
+
+def test_retry_with_exponential_backoff_reraises_after_max_retries():
+    """Test that the last exception propagates once retries are exhausted"""
+    @retry_with_exponential_backoff(max_retries=2)
+    def always_fails():
+        raise RuntimeError('down')
+
+    with patch('podcast_llm.utils.rate_limits.time.sleep'):
+        with pytest.raises(RuntimeError):
+            always_fails()